@@ -1,6 +1,7 @@
+import argparse
 import asyncio
-import json
 import time
+from contextlib import nullcontext
 from dotenv import load_dotenv
 from semantic_kernel.agents import AzureResponsesAgent
 from semantic_kernel.contents import (
@@ -14,6 +15,8 @@ from skills.booking_skill import BookingPlugin
 from skills.dining_skill import DiningPlugin
 from skills.semantic_search_plugin import SemanticRoomSearchPlugin
 from skills.time_skill import TimePlugin
+from utils.profiling import TurnProfiler
+from utils.record_store import RecordWriter
 
 # Load environment variables
 load_dotenv()
@@ -40,11 +43,19 @@ async def handle_intermediate_steps(message: ChatMessageContent):
             print(f"✅  Tool Result from {item.name} (duration: {duration})")
             print(f"   → {item.result}")
 
-async def run_simulation():
+OUTPUT_PATHS = {
+    None: "evaluation_dataset.jsonl",
+    "gzip": "evaluation_dataset.jsonl.gz",
+    "zstd": "evaluation_dataset.jsonl.zst",
+}
+
+async def run_simulation(profile: bool = False, profile_dir: str = "profiles", profile_memory: bool = False, compression: str | None = None):
     """
     Sets up the agent, runs a series of simulated queries against the agent,
     and logs the entire interaction (user query, tool calls, and final response)
-    into a JSONL evaluation file.
+    into a JSONL evaluation file, or a chunked record store when compression
+    is "gzip" or "zstd". With profile=True, each query is profiled into its
+    own artifact directory under profile_dir (profile_memory adds tracemalloc).
     """
     # Setup agent resources and instantiate the agent with your skills.
     client, model = AzureResponsesAgent.setup_resources()
@@ -76,6 +87,10 @@ async def run_simulation():
         ],
     )
 
+    profiler = TurnProfiler(profile_dir, trace_memory=profile_memory) if profile else None
+    if profiler:
+        profiler.attach(concierge_agent)
+
     # Define a set of simulated user queries covering various skills.
     simulated_queries = [
         "I need a deluxe room for tomorrow. Can you check if any are available?",
@@ -178,8 +193,9 @@ async def run_simulation():
         }
     }
 
-    # Open evaluation dataset file for writing in JSONL format.
-    with open("evaluation_dataset.jsonl", "w") as file:
+    # Open evaluation dataset file for writing in JSONL or record store format.
+    output_path = OUTPUT_PATHS[compression]
+    with RecordWriter(output_path, compression) as writer:
         thread = None  # Maintains conversation context if needed.
         for query in simulated_queries:
             print(f"\n👤 User: {query}")
@@ -188,15 +204,16 @@ async def run_simulation():
             final_response = ""
 
             # Invoke the agent with the query; intermediate messages (tool calls/results) are captured via the callback.
-            async for response in concierge_agent.invoke(
-                messages=query,
-                thread=thread,
-                on_intermediate_message=handle_intermediate_steps,
-                stream=False
-            ):
-                thread = response.thread
-                final_response = str(response.content)  # Explicitly convert to string.
-                print(f"# ConciergeAgent: {final_response}\n")
+            async with profiler.turn(query) if profiler else nullcontext():
+                async for response in concierge_agent.invoke(
+                    messages=query,
+                    thread=thread,
+                    on_intermediate_message=handle_intermediate_steps,
+                    stream=False
+                ):
+                    thread = response.thread
+                    final_response = str(response.content)  # Explicitly convert to string.
+                    print(f"# ConciergeAgent: {final_response}\n")
 
             # Extract tool call details from intermediate steps for logging.
             tool_calls = []
@@ -228,13 +245,19 @@ async def run_simulation():
                 "tool_definitions": tool_defs,
                 "response": final_response,
             }
-            file.write(json.dumps(record) + "\n")
+            writer.write(record)
 
         # Optional cleanup: delete thread if your system requires it.
         if thread:
             await thread.delete()
 
-    print("Simulation completed and interactions have been logged to evaluation_dataset.jsonl.")
+    print(f"Simulation completed and interactions have been logged to {output_path}.")
 
 if __name__ == "__main__":
-    asyncio.run(run_simulation())
+    parser = argparse.ArgumentParser(description="Simulate concierge conversations and log them for evaluation.")
+    parser.add_argument("--profile", action="store_true", help="Write per-turn profiling artifacts.")
+    parser.add_argument("--profile-dir", default="profiles", help="Root directory for profiling artifacts.")
+    parser.add_argument("--profile-memory", action="store_true", help="Also record tracemalloc snapshots (slows local work).")
+    parser.add_argument("--compression", choices=["gzip", "zstd"], help="Write a chunked, compressed record store instead of plain JSONL.")
+    args = parser.parse_args()
+    asyncio.run(run_simulation(args.profile, args.profile_dir, args.profile_memory, args.compression))
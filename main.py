@@ -1,5 +1,7 @@
+import argparse
 import asyncio
 import time
+from contextlib import nullcontext
 from dotenv import load_dotenv
 from semantic_kernel.agents import AzureResponsesAgent
 from semantic_kernel.contents import (
@@ -12,6 +14,7 @@ from skills.booking_skill import BookingPlugin
 from skills.dining_skill import DiningPlugin
 from skills.time_skill import TimePlugin
 from skills.semantic_search_plugin import SemanticRoomSearchPlugin
+from utils.profiling import TurnProfiler
 
 load_dotenv()
 
@@ -33,7 +36,7 @@ async def handle_intermediate_steps(message: ChatMessageContent):
             print(f"\033[1;32m✅ Tool Result from {item.name} (duration: {duration})\033[0m")
             print(f"   → {item.result}")
 
-async def main():
+async def main(profile: bool = False, profile_dir: str = "profiles", profile_memory: bool = False):
     client, model = AzureResponsesAgent.setup_resources()
 
     concierge_agent = AzureResponsesAgent(
@@ -70,6 +73,10 @@ async def main():
         ],
     )
 
+    profiler = TurnProfiler(profile_dir, trace_memory=profile_memory) if profile else None
+    if profiler:
+        profiler.attach(concierge_agent)
+
     thread = None
 
     print("🛎️  Welcome to the Smart Hospitality Assistant")
@@ -80,17 +87,23 @@ async def main():
         if user_input.lower() in ["exit", "quit"]:
             break
 
-        async for response in concierge_agent.invoke(
-            messages=user_input,
-            thread=thread,
-            on_intermediate_message=handle_intermediate_steps,
-            stream=False,
-        ):
-            thread = response.thread
-            print(f"# ConciergeAgent: {response.content}\n")
+        async with profiler.turn(user_input) if profiler else nullcontext():
+            async for response in concierge_agent.invoke(
+                messages=user_input,
+                thread=thread,
+                on_intermediate_message=handle_intermediate_steps,
+                stream=False,
+            ):
+                thread = response.thread
+                print(f"# ConciergeAgent: {response.content}\n")
 
     await thread.delete() if thread else None
     print("👋 Session ended.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Smart Hospitality Assistant")
+    parser.add_argument("--profile", action="store_true", help="Write per-turn profiling artifacts.")
+    parser.add_argument("--profile-dir", default="profiles", help="Root directory for profiling artifacts.")
+    parser.add_argument("--profile-memory", action="store_true", help="Also record tracemalloc snapshots (slows local work).")
+    args = parser.parse_args()
+    asyncio.run(main(args.profile, args.profile_dir, args.profile_memory))
@@ -1,10 +1,10 @@
 from typing import Annotated
 from semantic_kernel.functions import kernel_function
-from utils.cosmosdb_client import CosmosDBClient
+from utils.inventory_store import get_inventory_store
 
 class BookingPlugin:
     def __init__(self):
-        self.db = CosmosDBClient()
+        self.db = get_inventory_store()
 
     @kernel_function(description="Check if a room is available on a certain date.")
     def check_availability(
@@ -32,4 +32,6 @@ class BookingPlugin:
         if room["available"] < count:
             return f"Only {room['available']} {room_type} rooms available for {date}."
         updated = self.db.update_room_count(room_type, date, count)
+        if not updated:
+            return f"Sorry, the {room_type} booking for {date} could not be confirmed because availability just changed. Please check availability again."
         return f"✅ Booking confirmed for {count} {room_type} room(s) on {date} at {room['price']}."
@@ -1,12 +1,12 @@
 from typing import Annotated
 from semantic_kernel.functions import kernel_function
-from utils.cosmosdb_client import CosmosDBClient
+from utils.inventory_store import get_inventory_store
 from openai import AzureOpenAI
 import os
 
 class SemanticRoomSearchPlugin:
     def __init__(self):
-        self.db = CosmosDBClient()
+        self.db = get_inventory_store()
         self.openai = AzureOpenAI(
             api_key=os.getenv("AZURE_OPENAI_API_KEY"),
             api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
@@ -27,19 +27,7 @@ class SemanticRoomSearchPlugin:
     ) -> Annotated[str, "Returns a short list of rooms matching the request."]:
         embedding = self.embed_query(query)
 
-        sql_query = """
-        SELECT TOP 3 r.roomType, r.description, r.price, r.available, r.date
-        FROM rooms r
-        ORDER BY VectorDistance(r.vectorDescription, @embedding)
-        """
-
-        results = self.db.container.query_items(
-            query=sql_query,
-            parameters=[
-                {"name": "@embedding", "value": embedding}
-            ],
-            enable_cross_partition_query=True
-        )
+        results = self.db.search_rooms(embedding, top_k=3)
 
         output = ""
         for item in results:
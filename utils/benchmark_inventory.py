@@ -0,0 +1,104 @@
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+ROOM_TYPES = ["suite", "double", "single", "loft", "penthouse", "family", "garden", "executive", "accessible", "eco"]
+
+def build_workload(num_dates: int, dims: int, ops: int, seed: int):
+    """Builds synthetic room records and a fixed sequence of operations shared by every backend."""
+    rng = random.Random(seed)
+    dates = [f"2025-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)][:num_dates]
+
+    rooms = [
+        {
+            "id": f"{room_type}_{date}",
+            "roomType": room_type,
+            "date": date,
+            "available": rng.randint(1, 5),
+            "price": f"${rng.randint(100, 500)}",
+            "description": f"Benchmark {room_type} room for {date}.",
+            "vectorDescription": [rng.uniform(-1, 1) for _ in range(dims)]
+        }
+        for room_type in ROOM_TYPES
+        for date in dates
+    ]
+    lookups = [(rng.choice(ROOM_TYPES), rng.choice(dates)) for _ in range(ops)]
+    queries = [[rng.uniform(-1, 1) for _ in range(dims)] for _ in range(ops)]
+    return rooms, lookups, queries
+
+def timed(fn, args_list):
+    """Runs fn over each argument tuple and returns per-call latencies in milliseconds."""
+    latencies = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def report(backend: str, name: str, latencies: list[float]):
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{backend:<8} {name:<22} n={len(latencies):<6} "
+        f"mean={statistics.mean(latencies):8.2f}ms  p50={statistics.median(latencies):8.2f}ms  p95={p95:8.2f}ms"
+    )
+
+def run_benchmark(backend: str, store, rooms, lookups, queries, top_k: int):
+    report(backend, "bulk upsert", timed(store.upsert_rooms, [(rooms,)]))
+    report(backend, "availability read", timed(store.get_room_availability, lookups))
+    report(backend, "atomic decrement", timed(store.update_room_count, [(room_type, date, 1) for room_type, date in lookups]))
+    report(backend, f"vector top-{top_k}", timed(store.search_rooms, [(query, top_k) for query in queries]))
+
+def create_store(backend: str, workdir: str, dims: int):
+    if backend == "sqlite":
+        from utils.sqlite_client import SQLiteClient
+        return SQLiteClient(os.path.join(workdir, "benchmark.db"))
+    if backend == "cosmos":
+        # Never benchmark against the live inventory container. A missing benchmark container
+        # is created with the same vector policies as utils/seed_cosmosdb.py; an existing one
+        # must carry a matching vector policy or the top-k numbers would not be comparable.
+        from utils.cosmosdb_client import CosmosDBClient
+        container_name = os.getenv("COSMOS_BENCHMARK_CONTAINER_NAME") or "rooms_benchmark"
+        if container_name == os.getenv("COSMOS_CONTAINER_NAME"):
+            raise RuntimeError(
+                f"COSMOS_BENCHMARK_CONTAINER_NAME resolves to the live inventory container '{container_name}'. "
+                "Point it at a dedicated benchmark container."
+            )
+        store = CosmosDBClient(container_name, vector_dimensions=dims)
+        embeddings = store.container.read().get("vectorEmbeddingPolicy", {}).get("vectorEmbeddings", [])
+        if not any(e.get("path") == "/vectorDescription" and e.get("dimensions") == dims for e in embeddings):
+            raise RuntimeError(
+                f"Cosmos container '{container_name}' has no {dims}-dim vector policy on /vectorDescription. "
+                "Delete it or point COSMOS_BENCHMARK_CONTAINER_NAME at a new container."
+            )
+        return store
+    raise ValueError(f"Unknown backend '{backend}'. Expected 'cosmos' or 'sqlite'.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run identical inventory workloads against each storage backend.")
+    parser.add_argument("--backends", nargs="+", default=["sqlite"], choices=["sqlite", "cosmos"])
+    parser.add_argument("--dates", type=int, default=30, help="Dates per room type (10 room types).")
+    parser.add_argument("--dims", type=int, default=1536, help="Embedding dimensions.")
+    parser.add_argument("--ops", type=int, default=200, help="Operations per read/write/search phase.")
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rooms, lookups, queries = build_workload(args.dates, args.dims, args.ops, args.seed)
+    print(f"Workload: {len(rooms)} rooms, {args.dims} dims, {args.ops} ops per phase\n")
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as workdir:
+        for backend in args.backends:
+            store = create_store(backend, workdir, args.dims)
+            run_benchmark(backend, store, rooms, lookups, queries, args.top_k)
+            print()
+
+if __name__ == "__main__":
+    main()
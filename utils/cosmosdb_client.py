@@ -1,8 +1,11 @@
+import json
 import os
 from dotenv import load_dotenv
 from openai import AzureOpenAI 
-from azure.cosmos import CosmosClient, PartitionKey
+from azure.core import MatchConditions
+from azure.cosmos import CosmosClient, PartitionKey, exceptions
 from azure.identity import DefaultAzureCredential
+from utils.inventory_store import InventoryStore
 
 load_dotenv()
 
@@ -19,39 +22,140 @@ def generate_embeddings(text):
         input = [text], 
         model=os.getenv("AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT")).data[0].embedding
 
-class CosmosDBClient:
-    def __init__(self):
+# Transactional batches are limited to 100 operations and 2 MB of payload per partition key.
+# A 1536-dim embedding serializes to ~32 KB, so batches are also split by serialized size,
+# leaving headroom below 2 MB for request overhead.
+BATCH_SIZE = 100
+BATCH_MAX_BYTES = 1_800_000
+
+# Attempts before update_room_count gives up on a contended record.
+MAX_UPDATE_ATTEMPTS = 5
+
+VECTOR_DIMENSIONS = 1536  # text-3-embedding-small output dimensions
+
+def vector_container_policies(dimensions: int = VECTOR_DIMENSIONS):
+    """Returns the (indexing_policy, vector_embedding_policy) used for room containers."""
+    vector_embedding_policy = {
+        "vectorEmbeddings": [
+            {
+                "path": "/vectorDescription",
+                "dataType": "float32",
+                "dimensions": dimensions,
+                "distanceFunction": "cosine"
+            }
+        ]
+    }
+    indexing_policy = {
+        "includedPaths": [
+            {
+                "path": "/*"
+            }
+        ],
+        "excludedPaths": [
+            {
+                "path": "/\"_etag\"/?"
+            },
+            {
+                "path": "/vectorDescription/*"
+            }
+        ],
+        "vectorIndexes": [
+            {
+                "path": "/vectorDescription",
+                "type": "quantizedFlat"
+            }
+        ]
+    }
+    return indexing_policy, vector_embedding_policy
+
+class CosmosDBClient(InventoryStore):
+    def __init__(self, container_name: str | None = None, vector_dimensions: int = VECTOR_DIMENSIONS):
         endpoint = os.getenv("COSMOS_ENDPOINT")
         key = os.getenv("COSMOS_KEY")
         db_name = os.getenv("COSMOS_DB_NAME")
-        container_name = os.getenv("COSMOS_CONTAINER_NAME")
+        if container_name is None:
+            container_name = os.getenv("COSMOS_CONTAINER_NAME")
+        if not container_name:
+            raise ValueError("A Cosmos container name is required (set COSMOS_CONTAINER_NAME).")
 
         self.client = CosmosClient(endpoint, credential=credential)
         self.database = self.client.create_database_if_not_exists(db_name)
+        indexing_policy, vector_embedding_policy = vector_container_policies(vector_dimensions)
         self.container = self.database.create_container_if_not_exists(
             id=container_name,
             partition_key=PartitionKey(path="/roomType"),
+            indexing_policy=indexing_policy,
+            vector_embedding_policy=vector_embedding_policy,
             offer_throughput=400
         )
 
     def get_room_availability(self, room_type: str, date: str):
-        query = f"SELECT * FROM rooms r WHERE r.roomType = '{room_type}' AND r.date = '{date}'"
-        items = list(self.container.query_items(query=query, enable_cross_partition_query=True))
+        query = "SELECT * FROM rooms r WHERE r.roomType = @roomType AND r.date = @date"
+        items = list(self.container.query_items(
+            query=query,
+            parameters=[
+                {"name": "@roomType", "value": room_type},
+                {"name": "@date", "value": date}
+            ],
+            partition_key=room_type
+        ))
         return items[0] if items else None
 
     def update_room_count(self, room_type: str, date: str, count: int):
-        doc = self.get_room_availability(room_type, date)
-        if doc:
-            doc["available"] = max(0, doc["available"] - count)
-            self.container.upsert_item(doc)
-            return doc
+        # Optimistic concurrency: retry the read-modify-write if the etag changed underneath us.
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            doc = self.get_room_availability(room_type, date)
+            if not doc or doc["available"] < count:
+                return None
+            doc["available"] -= count
+            try:
+                return self.container.replace_item(
+                    item=doc["id"],
+                    body=doc,
+                    etag=doc["_etag"],
+                    match_condition=MatchConditions.IfNotModified
+                )
+            except exceptions.CosmosAccessConditionFailedError:
+                continue
         return None
 
+    def upsert_rooms(self, rooms: list[dict]) -> int:
+        by_partition = {}
+        for room in rooms:
+            by_partition.setdefault(room["roomType"], []).append(room)
+
+        for room_type, docs in by_partition.items():
+            operations, size = [], 0
+            for doc in docs:
+                doc_size = len(json.dumps(doc).encode("utf-8"))
+                if operations and (len(operations) >= BATCH_SIZE or size + doc_size > BATCH_MAX_BYTES):
+                    self.container.execute_item_batch(batch_operations=operations, partition_key=room_type)
+                    operations, size = [], 0
+                operations.append(("upsert", (doc,)))
+                size += doc_size
+            if operations:
+                self.container.execute_item_batch(batch_operations=operations, partition_key=room_type)
+        return len(rooms)
+
+    def search_rooms(self, embedding: list[float], top_k: int = 3) -> list[dict]:
+        query = f"""
+        SELECT TOP {int(top_k)} r.roomType, r.description, r.price, r.available, r.date
+        FROM rooms r
+        ORDER BY VectorDistance(r.vectorDescription, @embedding)
+        """
+        return list(self.container.query_items(
+            query=query,
+            parameters=[
+                {"name": "@embedding", "value": embedding}
+            ],
+            enable_cross_partition_query=True
+        ))
+
     def insert_room_record(self, room_type: str, date: str, available: int, price: str, description: str):
         doc_id = f"{room_type}_{date}"
         vector = generate_embeddings(description)
 
-        self.container.upsert_item({
+        self.upsert_rooms([{
             "id": doc_id,
             "roomType": room_type,
             "date": date,
@@ -59,4 +163,4 @@ class CosmosDBClient:
             "price": price,
             "description": description,
             "vectorDescription": vector
-        })
+        }])
@@ -0,0 +1,43 @@
+import os
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+
+class InventoryStore(ABC):
+    """Storage interface for the hotel room inventory used by the plugins."""
+
+    @abstractmethod
+    def get_room_availability(self, room_type: str, date: str):
+        """Returns the room record for a room type and date, or None."""
+
+    @abstractmethod
+    def update_room_count(self, room_type: str, date: str, count: int):
+        """
+        Atomically decrements the available count of a room record.
+        Returns the updated record, or None if the record does not exist,
+        has fewer than `count` rooms left, or stays contended after retries.
+        """
+
+    @abstractmethod
+    def upsert_rooms(self, rooms: list[dict]) -> int:
+        """Inserts or replaces room records in bulk. Returns the number written."""
+
+    @abstractmethod
+    def search_rooms(self, embedding: list[float], top_k: int = 3) -> list[dict]:
+        """Returns the `top_k` room records closest to the embedding by cosine distance."""
+
+
+@lru_cache(maxsize=None)
+def get_inventory_store(backend: str | None = None) -> InventoryStore:
+    """
+    Returns the inventory store selected by the INVENTORY_BACKEND environment
+    variable ("cosmos" or "sqlite"). Defaults to "cosmos".
+    """
+    backend = (backend or os.getenv("INVENTORY_BACKEND") or "cosmos").lower()
+    if backend == "cosmos":
+        from utils.cosmosdb_client import CosmosDBClient
+        return CosmosDBClient()
+    if backend == "sqlite":
+        from utils.sqlite_client import SQLiteClient
+        return SQLiteClient()
+    raise ValueError(f"Unknown INVENTORY_BACKEND '{backend}'. Expected 'cosmos' or 'sqlite'.")
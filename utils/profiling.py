@@ -0,0 +1,282 @@
+import asyncio
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+# Files holding the selector poll the event loop blocks in while it has nothing to run.
+_SELECTOR_FILES = ("selectors.py", "windows_events.py")
+
+class StackSampler:
+    """
+    Samples the stack of one thread at a fixed interval. Samples taken while the
+    event loop is idle in its selector poll (waiting on the model or other I/O)
+    are only counted, so the flamegraph (folded stacks) and pstats profile cover
+    local work on the loop thread. Sampling adds only the sampling thread's
+    overhead to the measured turn.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self.seconds = Counter()
+        self.idle_samples = 0
+        self.idle_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="StackSampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name, frame.f_lineno))
+                frame = frame.f_back
+            if stack:
+                stack = tuple(reversed(stack))
+                # Weight by the real gap between samples, which stretches when the GIL is contended.
+                if _is_idle(stack):
+                    self.idle_samples += 1
+                    self.idle_seconds += now - last
+                else:
+                    self.samples[stack] += 1
+                    self.seconds[stack] += now - last
+            last = now
+
+    def write_folded(self, path: str):
+        """Writes collapsed stacks, loadable by flamegraph.pl, speedscope or inferno."""
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.samples.most_common():
+                frames = ";".join(f"{name} ({os.path.basename(filename)}:{lineno})" for filename, _, name, lineno in stack)
+                file.write(f"{frames} {count}\n")
+
+    def write_pstats(self, path: str):
+        """Writes the samples as a pstats file; times are sample-weighted estimates and call counts are sample counts."""
+        pstats.Stats(_SampledProfile(self)).dump_stats(path)
+
+def _is_idle(stack) -> bool:
+    """True when every frame below the innermost BaseEventLoop._run_once is the selector poll."""
+    for depth in range(len(stack) - 1, -1, -1):
+        filename, _, name, _ = stack[depth]
+        if name == "_run_once" and os.path.basename(filename) == "base_events.py":
+            below = stack[depth + 1:]
+            return bool(below) and all(os.path.basename(f) in _SELECTOR_FILES for f, _, _, _ in below)
+    return False
+
+class _SampledProfile:
+    """Adapts sampled stacks to the create_stats()/stats protocol pstats.Stats loads from."""
+
+    def __init__(self, sampler: StackSampler):
+        self.sampler = sampler
+        self.stats = {}
+
+    def create_stats(self):
+        stats = {}
+        for stack, count in self.sampler.samples.items():
+            seconds = self.sampler.seconds[stack]
+            functions = [(filename, firstlineno, name) for filename, firstlineno, name, _ in stack]
+            leaf = functions[-1]
+            # Count each function once per sample so recursion does not inflate cumulative time.
+            for function in set(functions):
+                cc, nc, tt, ct, callers = stats.get(function, (0, 0, 0.0, 0.0, {}))
+                stats[function] = (cc + count, nc + count, tt + (seconds if function == leaf else 0.0), ct + seconds, callers)
+            for caller, callee in set(zip(functions, functions[1:])):
+                callers = stats[callee][4]
+                cc, nc, tt, ct = callers.get(caller, (0, 0, 0.0, 0.0))
+                callers[caller] = (cc + count, nc + count, tt + (seconds if callee == leaf else 0.0), ct + seconds)
+        self.stats = stats
+
+class LoopBlockingMonitor:
+    """Detects intervals where the event loop could not run a heartbeat on time."""
+
+    def __init__(self, interval: float = 0.01, threshold: float = 0.05):
+        self.interval = interval
+        self.threshold = threshold
+        self.intervals = []
+        self._task = None
+
+    async def start(self, origin: float):
+        self._task = asyncio.get_running_loop().create_task(self._run(origin))
+        # Let the heartbeat take its first timestamp before the profiled code runs.
+        await asyncio.sleep(0)
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, origin: float):
+        while True:
+            start = time.perf_counter()
+            try:
+                await asyncio.sleep(self.interval)
+            finally:
+                # Also runs on cancellation, so a block right before the turn ends is still recorded.
+                lag = time.perf_counter() - start - self.interval
+                if lag > self.threshold:
+                    self.intervals.append({
+                        "start_s": round(start + self.interval - origin, 4),
+                        "duration_s": round(lag, 4),
+                    })
+
+class TurnProfiler:
+    """
+    Profiles each agent turn and writes one artifact directory per turn:
+    a sampled profile of local work on the loop thread, excluding time the
+    loop sits idle waiting on I/O (pstats and folded stacks for flamegraphs),
+    event-loop blocking intervals and a wall time summary that splits model
+    wait from local work. tracemalloc snapshots are opt-in (trace_memory=True)
+    because tracing every allocation inflates the local time being measured.
+    """
+
+    def __init__(self, output_dir: str = "profiles", sample_interval: float = 0.005,
+                 trace_memory: bool = False, top_allocations: int = 25):
+        # PID plus a counter keeps runs started in the same second from sharing a session directory.
+        session = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        attempt = 0
+        while True:
+            self.session_dir = os.path.join(output_dir, f"{session}-{attempt}" if attempt else session)
+            try:
+                os.makedirs(self.session_dir)
+                break
+            except FileExistsError:
+                attempt += 1
+        self.sample_interval = sample_interval
+        self.trace_memory = trace_memory
+        self.top_allocations = top_allocations
+        self.turn_index = 0
+        self._timings = None
+
+    def attach(self, agent):
+        """Hooks the agent's model client and kernel so model and tool time are attributed per turn."""
+        responses = agent.client.responses
+        create = responses.create
+
+        async def timed_create(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await create(*args, **kwargs)
+            finally:
+                self._record("model", start, time.perf_counter())
+
+        responses.create = timed_create
+        agent.kernel.add_filter("function_invocation", self._function_invocation_filter)
+
+    async def _function_invocation_filter(self, context, next):
+        start = time.perf_counter()
+        try:
+            await next(context)
+        finally:
+            self._record("tool", start, time.perf_counter(), context.function.fully_qualified_name)
+
+    def _record(self, kind: str, start: float, end: float, name: str | None = None):
+        if self._timings is None:
+            return
+        self._timings[kind].append((start, end))
+        if name:
+            self._timings["tools"].append({"name": name, "duration_s": round(end - start, 4)})
+
+    @asynccontextmanager
+    async def turn(self, query: str):
+        """Profiles everything awaited inside the block as one turn."""
+        self.turn_index += 1
+        turn_dir = os.path.join(self.session_dir, f"turn_{self.turn_index:03d}")
+        os.makedirs(turn_dir)
+
+        self._timings = {"model": [], "tool": [], "tools": []}
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            snapshot_before = tracemalloc.take_snapshot()
+
+        sampler = StackSampler(threading.get_ident(), self.sample_interval)
+        monitor = LoopBlockingMonitor()
+
+        start = time.perf_counter()
+        await monitor.start(start)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            await monitor.stop()
+            wall = time.perf_counter() - start
+            timings, self._timings = self._timings, None
+
+            sampler.write_pstats(os.path.join(turn_dir, "profile.pstats"))
+            sampler.write_folded(os.path.join(turn_dir, "flamegraph.folded"))
+            with open(os.path.join(turn_dir, "loop_blocking.json"), "w", encoding="utf-8") as file:
+                json.dump(monitor.intervals, file, indent=2)
+
+            peak = None
+            if self.trace_memory:
+                snapshot_after = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                snapshot_after.dump(os.path.join(turn_dir, "tracemalloc.snapshot"))
+                with open(os.path.join(turn_dir, "tracemalloc_top.txt"), "w", encoding="utf-8") as file:
+                    for stat in snapshot_after.compare_to(snapshot_before, "lineno")[:self.top_allocations]:
+                        file.write(f"{stat}\n")
+
+            # Tool calls can run concurrently, so time is the union of intervals, not their sum.
+            model = _union_seconds(timings["model"])
+            tools = _union_seconds(timings["tool"])
+            busy = _union_seconds(timings["model"] + timings["tool"])
+            summary = {
+                "turn": self.turn_index,
+                "query": query,
+                "wall_s": round(wall, 4),
+                "model_wait_s": round(model, 4),
+                "model_calls": len(timings["model"]),
+                "local_s": round(wall - model, 4),
+                "tool_s": round(tools, 4),
+                "tool_calls": len(timings["tool"]),
+                "other_local_s": round(wall - busy, 4),
+                "sampled_local_s": round(sum(sampler.seconds.values()), 4),
+                "sampled_idle_s": round(sampler.idle_seconds, 4),
+                "loop_blocked_s": round(sum(i["duration_s"] for i in monitor.intervals), 4),
+                "loop_blocking_intervals": len(monitor.intervals),
+                "memory_traced": self.trace_memory,
+                "peak_traced_memory_bytes": peak,
+                "tools": timings["tools"],
+            }
+            with open(os.path.join(turn_dir, "summary.json"), "w", encoding="utf-8") as file:
+                json.dump(summary, file, indent=2)
+
+            print(
+                f"⏱️  Turn {self.turn_index}: wall {wall:.2f}s | model {model:.2f}s | "
+                f"tools {tools:.2f}s | other local {summary['other_local_s']:.2f}s | "
+                f"loop blocked {summary['loop_blocked_s']:.2f}s → {turn_dir}"
+            )
+
+def _union_seconds(intervals: list[tuple[float, float]]) -> float:
+    total, current_start, current_end = 0.0, None, None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
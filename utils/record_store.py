@@ -0,0 +1,231 @@
+import argparse
+import bisect
+import gzip
+import json
+import os
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+INDEX_SUFFIX = ".index.json"
+FORMAT_VERSION = 1
+
+# Leading bytes of gzip members and zstd frames, used to recognize a store whose index is missing.
+COMPRESSED_MAGIC = (b"\x1f\x8b", b"\x28\xb5\x2f\xfd")
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    raise ValueError(f"Unknown compression '{compression}'. Expected 'gzip' or 'zstd'.")
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown compression '{compression}'. Expected 'gzip' or 'zstd'.")
+
+def _require_codec(compression: str | None):
+    if compression == "zstd" and zstandard is None:
+        raise ImportError("zstd compression requires the 'zstandard' package (pip install zstandard).")
+
+class RecordWriter:
+    """
+    Writes evaluation records either as plain JSONL (compression=None) or as a
+    chunked, compressed record store. In a store every chunk is an independent
+    gzip/zstd frame of JSONL, tool definitions are interned once in the sidecar
+    index and records reference them by position.
+    """
+
+    def __init__(self, path: str, compression: str | None = "gzip", chunk_size: int = 1000):
+        _require_codec(compression)
+        self.path = path
+        self.compression = compression
+        self.chunk_size = chunk_size
+        self.count = 0
+        # Drop any sidecar left by an earlier store at this path, so a plain JSONL file (or a
+        # store interrupted mid-write) is never read through a stale index.
+        if os.path.exists(path + INDEX_SUFFIX):
+            os.remove(path + INDEX_SUFFIX)
+        self._file = open(path, "wb")
+        self._buffer = []
+        self._flushed = 0
+        self._chunks = []
+        self._tool_definitions = []
+        self._tool_keys = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, record: dict):
+        if self.compression is None:
+            self._file.write((json.dumps(record) + "\n").encode("utf-8"))
+        else:
+            if "tool_definitions" in record:
+                record = dict(record, tool_definitions=[self._intern(d) for d in record["tool_definitions"]])
+            self._buffer.append(json.dumps(record))
+        self.count += 1
+        if len(self._buffer) >= self.chunk_size:
+            self._flush_chunk()
+
+    def _intern(self, tool_definition: dict) -> int:
+        key = json.dumps(tool_definition, sort_keys=True)
+        if key not in self._tool_keys:
+            self._tool_keys[key] = len(self._tool_definitions)
+            self._tool_definitions.append(tool_definition)
+        return self._tool_keys[key]
+
+    def _flush_chunk(self):
+        if not self._buffer:
+            return
+        data = _compress(("\n".join(self._buffer) + "\n").encode("utf-8"), self.compression)
+        self._chunks.append({
+            "offset": self._file.tell(),
+            "length": len(data),
+            "first": self._flushed,
+            "records": len(self._buffer),
+        })
+        self._file.write(data)
+        self._flushed += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.compression is not None:
+            self._flush_chunk()
+        self._file.close()
+        if self.compression is not None:
+            index = {
+                "version": FORMAT_VERSION,
+                "compression": self.compression,
+                "records": self.count,
+                "tool_definitions": self._tool_definitions,
+                "chunks": self._chunks,
+            }
+            with open(self.path + INDEX_SUFFIX, "w", encoding="utf-8") as file:
+                json.dump(index, file)
+
+class RecordStore:
+    """
+    Reads a record store written by RecordWriter. Iteration streams one chunk
+    at a time, indexing decompresses only the chunk holding the record, and
+    shard() splits chunks across worker processes. Records are returned in the
+    original format with tool definitions expanded inline.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path + INDEX_SUFFIX, "r", encoding="utf-8") as file:
+            index = json.load(file)
+        if index.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported record store version {index.get('version')} in {path}{INDEX_SUFFIX}.")
+        self.compression = index["compression"]
+        _require_codec(self.compression)
+        self.tool_definitions = index["tool_definitions"]
+        self.chunks = index["chunks"]
+        self._records = index["records"]
+        self._firsts = [chunk["first"] for chunk in self.chunks]
+        self._cached_chunk = None
+        self._cached_records = None
+
+    def __len__(self):
+        return self._records
+
+    def __iter__(self):
+        return self.iter_chunks(range(len(self.chunks)))
+
+    def __getitem__(self, i: int) -> dict:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("record index out of range")
+        chunk_index = bisect.bisect_right(self._firsts, i) - 1
+        if self._cached_chunk != chunk_index:
+            with open(self.path, "rb") as file:
+                self._cached_records = self._read_chunk(file, chunk_index)
+            self._cached_chunk = chunk_index
+        return self._expand(self._cached_records[i - self._firsts[chunk_index]])
+
+    def shard(self, worker_index: int, worker_count: int):
+        """Yields the records of every chunk assigned to this worker (round-robin by chunk)."""
+        return self.iter_chunks(range(worker_index, len(self.chunks), worker_count))
+
+    def iter_chunks(self, chunk_indexes):
+        with open(self.path, "rb") as file:
+            for chunk_index in chunk_indexes:
+                for record in self._read_chunk(file, chunk_index):
+                    yield self._expand(record)
+
+    def _read_chunk(self, file, chunk_index: int) -> list[dict]:
+        chunk = self.chunks[chunk_index]
+        file.seek(chunk["offset"])
+        data = _decompress(file.read(chunk["length"]), self.compression)
+        return [json.loads(line) for line in data.decode("utf-8").splitlines() if line]
+
+    def _expand(self, record: dict) -> dict:
+        if "tool_definitions" not in record:
+            return record
+        return dict(record, tool_definitions=[self.tool_definitions[i] for i in record["tool_definitions"]])
+
+def iter_records(path: str):
+    """Streams records from either a plain JSONL file or a record store."""
+    try:
+        store = RecordStore(path)
+    except FileNotFoundError:
+        with open(path, "rb") as file:
+            if file.read(4).startswith(COMPRESSED_MAGIC):
+                raise FileNotFoundError(
+                    f"{path} is a compressed record store but its index {path}{INDEX_SUFFIX} is missing; "
+                    "copy the index alongside the data file or regenerate the store."
+                ) from None
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        return
+    yield from store
+
+def jsonl_to_store(src: str, dst: str, compression: str = "gzip", chunk_size: int = 1000) -> int:
+    """Converts a plain evaluation JSONL file into a record store. Returns the number of records."""
+    with RecordWriter(dst, compression, chunk_size) as writer:
+        for record in iter_records(src):
+            writer.write(record)
+    return writer.count
+
+def store_to_jsonl(src: str, dst: str) -> int:
+    """Converts a record store back into a plain evaluation JSONL file. Returns the number of records."""
+    with RecordWriter(dst, compression=None) as writer:
+        for record in RecordStore(src):
+            writer.write(record)
+    return writer.count
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert evaluation datasets between plain JSONL and the record store format.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    pack = subparsers.add_parser("pack", help="Plain JSONL -> record store.")
+    pack.add_argument("src")
+    pack.add_argument("dst")
+    pack.add_argument("--compression", default="gzip", choices=["gzip", "zstd"])
+    pack.add_argument("--chunk-size", type=int, default=1000)
+    unpack = subparsers.add_parser("unpack", help="Record store -> plain JSONL.")
+    unpack.add_argument("src")
+    unpack.add_argument("dst")
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        count = jsonl_to_store(args.src, args.dst, args.compression, args.chunk_size)
+    else:
+        count = store_to_jsonl(args.src, args.dst)
+    print(f"{count} records written to {args.dst}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Room records shared by the seeding scripts
+rooms = [
+    {
+        "roomType": "suite",
+        "date": "2025-04-12",
+        "available": 2,
+        "price": "$250",
+        "description": "Spacious luxury suite with king-sized bed, ocean view, and elegant decor. Perfect for a romantic getaway."
+    },
+    {
+        "roomType": "double",
+        "date": "2025-04-12",
+        "available": 4,
+        "price": "$150",
+        "description": "Comfortable double room with modern design, desk space, and ideal for business travelers or families."
+    },
+    {
+        "roomType": "single",
+        "date": "2025-04-12",
+        "available": 5,
+        "price": "$120",
+        "description": "Cozy single room for solo travelers. Includes a reading nook, compact workspace, and courtyard view."
+    },
+    {
+        "roomType": "loft",
+        "date": "2025-04-12",
+        "available": 3,
+        "price": "$300",
+        "description": "Stylish open-plan loft with industrial vibes, exposed brick, and a full kitchen. Great for creative retreats."
+    },
+    {
+        "roomType": "penthouse",
+        "date": "2025-04-12",
+        "available": 1,
+        "price": "$500",
+        "description": "Premium penthouse suite with skyline views, private balcony, hot tub, and VIP amenities."
+    },
+    {
+        "roomType": "family",
+        "date": "2025-04-12",
+        "available": 3,
+        "price": "$200",
+        "description": "Large family suite with two queen beds, kid-friendly decor, and a small play area."
+    },
+    {
+        "roomType": "garden",
+        "date": "2025-04-12",
+        "available": 2,
+        "price": "$180",
+        "description": "Peaceful garden-view room with patio access, natural light, and a relaxing atmosphere for reading or yoga."
+    },
+    {
+        "roomType": "executive",
+        "date": "2025-04-12",
+        "available": 2,
+        "price": "$220",
+        "description": "Executive suite with private office space, ergonomic chair, espresso machine, and soundproofing for calls."
+    },
+    {
+        "roomType": "accessible",
+        "date": "2025-04-12",
+        "available": 2,
+        "price": "$140",
+        "description": "Wheelchair-accessible room with walk-in shower, grab bars, and extra floor space for mobility."
+    },
+    {
+        "roomType": "eco",
+        "date": "2025-04-12",
+        "available": 2,
+        "price": "$160",
+        "description": "Eco-friendly room with recycled materials, zero-waste amenities, and views of the green rooftop garden."
+    }
+]
@@ -0,0 +1,39 @@
+import os
+from openai import AzureOpenAI
+from dotenv import load_dotenv
+from utils.room_catalog import rooms
+from utils.sqlite_client import SQLiteClient
+
+# Load environment variables
+load_dotenv()
+
+# Initialize Azure OpenAI client
+openai_client = AzureOpenAI(
+    api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+    api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
+)
+
+def generate_embeddings(text):
+    """Generate embeddings for the given text using Azure OpenAI."""
+    response = openai_client.embeddings.create(
+        input=[text],
+        model=os.getenv("AZURE_OPENAI_EMBEDDINGS_DEPLOYMENT")
+    )
+    return response.data[0].embedding
+
+# Open (or create) the local inventory database
+store = SQLiteClient()
+
+# Build room records with vector embeddings and insert them in one transaction
+room_records = [
+    {
+        "id": f"{room['roomType']}_{room['date']}",
+        **room,
+        "vectorDescription": generate_embeddings(room["description"])
+    }
+    for room in rooms
+]
+count = store.upsert_rooms(room_records)
+
+print(f"{count} room records have been written to the SQLite inventory.")
@@ -0,0 +1,160 @@
+import os
+import sqlite3
+import threading
+import numpy as np
+from utils.inventory_store import InventoryStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rooms (
+    id TEXT PRIMARY KEY,
+    roomType TEXT NOT NULL,
+    date TEXT NOT NULL,
+    available INTEGER NOT NULL,
+    price TEXT,
+    description TEXT,
+    vectorDescription BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_rooms_roomType_date ON rooms (roomType, date);
+"""
+
+COLUMNS = "id, roomType, date, available, price, description"
+
+class SQLiteClient(InventoryStore):
+    """Embedded inventory store for local runs, tests and small properties."""
+
+    def __init__(self, db_path: str | None = None):
+        db_path = db_path or os.getenv("SQLITE_DB_PATH") or "inventory.db"
+
+        # Autocommit mode so transactions are only opened explicitly with BEGIN IMMEDIATE.
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        # The connection is shared across threads, so every statement runs under this lock;
+        # otherwise a read could land inside another thread's open BEGIN IMMEDIATE.
+        self._lock = threading.RLock()
+
+        # Normalized embedding matrix for the in-process vector scorer, rebuilt lazily after
+        # writes from this connection or, via PRAGMA data_version, from other connections.
+        self._vector_ids = None
+        self._vector_matrix = None
+        self._data_version = None
+
+    def get_room_availability(self, room_type: str, date: str):
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT {COLUMNS} FROM rooms WHERE roomType = ? AND date = ? LIMIT 1",
+                (room_type, date)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def update_room_count(self, room_type: str, date: str, count: int):
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                doc = self.get_room_availability(room_type, date)
+                if not doc or doc["available"] < count:
+                    self.conn.execute("ROLLBACK")
+                    return None
+                self.conn.execute(
+                    "UPDATE rooms SET available = available - ? WHERE id = ?",
+                    (count, doc["id"])
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        doc["available"] -= count
+        return doc
+
+    def upsert_rooms(self, rooms: list[dict]) -> int:
+        rows = [
+            (
+                room.get("id") or f"{room['roomType']}_{room['date']}",
+                room["roomType"],
+                room["date"],
+                room["available"],
+                room.get("price"),
+                room.get("description"),
+                _to_blob(room.get("vectorDescription"))
+            )
+            for room in rooms
+        ]
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    """
+                    INSERT INTO rooms (id, roomType, date, available, price, description, vectorDescription)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        roomType = excluded.roomType,
+                        date = excluded.date,
+                        available = excluded.available,
+                        price = excluded.price,
+                        description = excluded.description,
+                        vectorDescription = excluded.vectorDescription
+                    """,
+                    rows
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self._vector_ids = None
+            self._vector_matrix = None
+        return len(rows)
+
+    def search_rooms(self, embedding: list[float], top_k: int = 3) -> list[dict]:
+        ids, matrix = self._load_vectors()
+        if not ids:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        scores = matrix @ query
+
+        top_k = min(top_k, len(ids))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        best_ids = [ids[i] for i in best]
+
+        placeholders = ", ".join("?" for _ in best_ids)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT roomType, description, price, available, date, id FROM rooms WHERE id IN ({placeholders})",
+                best_ids
+            ).fetchall()
+        by_id = {row["id"]: row for row in rows}
+        return [
+            {key: by_id[doc_id][key] for key in ("roomType", "description", "price", "available", "date")}
+            for doc_id in best_ids
+            if doc_id in by_id
+        ]
+
+    def _load_vectors(self):
+        with self._lock:
+            data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._vector_ids is None or data_version != self._data_version:
+                rows = self.conn.execute(
+                    "SELECT id, vectorDescription FROM rooms WHERE vectorDescription IS NOT NULL"
+                ).fetchall()
+                ids = [row["id"] for row in rows]
+                if ids:
+                    matrix = np.vstack([np.frombuffer(row["vectorDescription"], dtype=np.float32) for row in rows])
+                    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                    norms[norms == 0] = 1.0
+                    matrix = matrix / norms
+                else:
+                    matrix = np.empty((0, 0), dtype=np.float32)
+                self._vector_ids = ids
+                self._vector_matrix = matrix
+                self._data_version = data_version
+            return self._vector_ids, self._vector_matrix
+
+def _to_blob(vector):
+    if vector is None:
+        return None
+    return np.asarray(vector, dtype=np.float32).tobytes()